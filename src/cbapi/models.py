@@ -49,13 +49,11 @@ class CbMetaModel(type):
         cls = super(CbMetaModel, mcs).__new__(mcs, name, bases, clsdict)
         mcs.model_classes.append(cls)
 
-        cls._valid_fields = []
-        cls._required_fields = model_data.get("required", [])
+        cls._valid_fields = frozenset(model_data.get("properties", {}))
+        cls._required_fields = frozenset(model_data.get("required", []))
         cls._default_value = {}
 
         for field_name, field_info in iteritems(model_data.get("properties", {})):
-            cls._valid_fields.append(field_name)
-
             default_value = field_info.get("default", None)
             if default_value:
                 cls._default_value[field_name] = default_value
@@ -144,7 +142,8 @@ class EpochDateTimeFieldDescriptor(FieldDescriptor):
 
     def __get__(self, instance, instance_type=None):
         d = super(EpochDateTimeFieldDescriptor, self).__get__(instance, instance_type)
-        if type(d) is float or isinstance(type(d), integer_types):
+        # NOTE: bool is an integer type, but never an epoch timestamp.
+        if isinstance(d, (float,) + integer_types) and not isinstance(d, bool):
             epoch_seconds = d / self.multiplier
             return datetime.utcfromtimestamp(epoch_seconds)
         else:
@@ -168,14 +167,16 @@ class ForeignKeyFieldDescriptor(FieldDescriptor):
             self.join_field = join_field
 
     def __get__(self, instance, instance_type=None):
+        if instance is None:
+            return self
         foreign_id = getattr(instance, self.join_field)
         return instance._cb.select(self.join_model, foreign_id)
 
     def __set__(self, instance, value):
-        if type(value, BaseModel) or type(value, NewBaseModel):
-            setattr(self, self.join_field, getattr(value, "_model_unique_id"))
+        if isinstance(value, (BaseModel, NewBaseModel)):
+            setattr(instance, self.join_field, getattr(value, "_model_unique_id"))
         else:
-            setattr(self, self.join_field, value)
+            setattr(instance, self.join_field, value)
 
 
 class BinaryFieldDescriptor(FieldDescriptor):
@@ -190,6 +191,9 @@ class BinaryFieldDescriptor(FieldDescriptor):
 @python_2_unicode_compatible
 @add_metaclass(CbMetaModel)
 class NewBaseModel(object):
+    # NOTE: Subclasses that don't declare __slots__ still get a __dict__ as usual;
+    # models created in bulk can declare their own __slots__ to avoid one per instance.
+    __slots__ = ("_cb", "_last_refresh_time", "_info", "_dirty_attributes", "_full_init")
     primary_key = "id"
 
     def __init__(self, cb, model_unique_id=None, initial_data=None, force_init=False, full_doc=False):
@@ -202,23 +206,37 @@ class NewBaseModel(object):
         :param full_doc:
         :return:
         """
-        self._cb = cb
-        self._last_refresh_time = 0
-
-        if initial_data is not None:
-            self._info = initial_data
-        else:
-            self._info = {}
+        self._init_base(cb, initial_data if initial_data is not None else {}, full_doc)
 
         if model_unique_id is not None:
             self._info[self.__class__.primary_key] = model_unique_id
 
-        self._dirty_attributes = {}
-        self._full_init = full_doc
-
         if force_init:
             self.refresh()
 
+    def _init_base(self, cb, info, full_doc):
+        # NOTE: Shared by __init__ and _new_bulk; every attribute in __slots__ is set here.
+        # Both __setattr__ overrides pass these private names straight to object.__setattr__,
+        # so call it directly and skip their per-attribute checks.
+        setattr_ = object.__setattr__
+        setattr_(self, "_cb", cb)
+        setattr_(self, "_last_refresh_time", 0)
+        setattr_(self, "_info", info)
+        setattr_(self, "_dirty_attributes", {})
+        setattr_(self, "_full_init", full_doc)
+
+    @classmethod
+    def _new_bulk(cls, cb, raws):
+        """Creates one fully-initialized instance per item of raw API data, without
+        going through ``__init__``. Callers set up any subclass-specific state.
+        """
+        objs = []
+        for raw in raws:
+            obj = cls.__new__(cls)
+            obj._init_base(cb, raw, True)
+            objs.append(obj)
+        return objs
+
     @property
     def _model_unique_id(self):
         return self._info.get(self.__class__.primary_key, None)
@@ -344,6 +362,8 @@ class UnrefreshableModel(NewBaseModel):
     """Represents a model that can't be refreshed, i.e. for which ``reset()``
     is not a valid operation.
     """
+    __slots__ = ()
+
     def refresh(self):
         raise ApiError("refresh() called on an unrefreshable model")
 
@@ -358,6 +378,9 @@ class MutableBaseModel(NewBaseModel):
         propobj = getattr(self.__class__, attrname, None)
         if isinstance(propobj, property) and propobj.fset:
             return propobj.fset(self, val)
+        # foreign keys aren't swagger fields, so hand them to their descriptor directly
+        if isinstance(propobj, ForeignKeyFieldDescriptor):
+            return propobj.__set__(self, val)
 
         if not attrname.startswith("_") and attrname not in self.__class__._valid_fields:
             if attrname in self._info:
@@ -494,7 +517,7 @@ class MutableBaseModel(NewBaseModel):
         if not self._full_init:
             self.refresh()
 
-        diff = list(set(self.__class__._required_fields) - set(self._info.keys()))
+        diff = list(self.__class__._required_fields.difference(self._info))
         if not diff:
             return True
         else:
@@ -20,7 +20,7 @@ class DefenseMutableModel(MutableBaseModel):
             self._change_object_key_name = self.primary_key
 
     def _parse(self, obj):
-        if type(obj) == dict and self.info_key in obj:
+        if isinstance(obj, dict) and self.info_key in obj:
             return obj[self.info_key]
 
     def _update_object(self):
@@ -132,7 +132,7 @@ class Event(NewBaseModel):
     info_key = "eventInfo"
 
     def _parse(self, obj):
-        if type(obj) == dict and self.info_key in obj:
+        if isinstance(obj, dict) and self.info_key in obj:
             return obj[self.info_key]
 
     def __init__(self, cb, model_unique_id, initial_data=None):
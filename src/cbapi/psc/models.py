@@ -23,7 +23,7 @@ class PSCMutableModel(MutableBaseModel):
             self._change_object_key_name = self.primary_key
 
     def _parse(self, obj):
-        if type(obj) == dict and self.info_key in obj:
+        if isinstance(obj, dict) and self.info_key in obj:
             return obj[self.info_key]
 
     def _update_object(self):
@@ -1,13 +1,28 @@
 from __future__ import absolute_import
 from cbapi.errors import ApiError, InvalidObjectError
 from cbapi.models import CreatableModelMixin, MutableBaseModel, UnrefreshableModel
+from cbapi.six import string_types
 import logging
-from cbapi.psc.threathunter.query import Query, AsyncProcessQuery, TreeQuery, FeedQuery, ReportQuery, WatchlistQuery
+from cbapi.psc.threathunter.query import (
+    Query, AsyncProcessQuery, TreeQuery, FeedQuery, ReportQuery, WatchlistQuery, EmptyQuery
+)
+from concurrent.futures import ThreadPoolExecutor
+import re
 import validators
 import time
 
 log = logging.getLogger(__name__)
 
+# NOTE: Matches only plain http(s) URLs that validators.url() also accepts, so
+# the common case skips the (much slower) full check; anything else falls through.
+_simple_url_re = re.compile(r"^https?://(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}(?:/[A-Za-z0-9._~-]*)*\Z")
+
+
+def _is_valid_url(url):
+    if isinstance(url, string_types) and _simple_url_re.match(url):
+        return True
+    return validators.url(url)
+
 
 class FeedModel(UnrefreshableModel, CreatableModelMixin, MutableBaseModel):
     """A common base class for models used by the Feed and Watchlist APIs.
@@ -18,9 +33,11 @@ class FeedModel(UnrefreshableModel, CreatableModelMixin, MutableBaseModel):
 class Process(UnrefreshableModel):
     """Represents a process retrieved by one of the CbTH endpoints.
     """
+    __slots__ = ("_process_hashes", "_summary", "_tree", "_children", "_siblings")
     default_sort = 'last_update desc'
     primary_key = "process_guid"
     validation_url = "/threathunter/search/v1/orgs/{}/processes/search_validation"
+    _query_cls = AsyncProcessQuery
 
     class Summary(UnrefreshableModel):
         """Represents a summary of organization-specific information for
@@ -36,8 +53,8 @@ class Process(UnrefreshableModel):
 
             while summary["incomplete_results"]:
                 log.debug("summary incomplete, requesting again")
-                summary = self._cb.get_object(
-                    url, query_parameters={"process_guid": self.process_guid}
+                summary = cb.get_object(
+                    url, query_parameters={"process_guid": model_unique_id}
                 )
 
             super(Process.Summary, self).__init__(cb, model_unique_id=model_unique_id,
@@ -47,17 +64,24 @@ class Process(UnrefreshableModel):
     @classmethod
     def _query_implementation(cls, cb):
         # This will emulate a synchronous process query, for now.
-        return AsyncProcessQuery(cls, cb)
+        return cls._query_cls(cls, cb)
 
     def __init__(self, cb, model_unique_id=None, initial_data=None, force_init=False, full_doc=True):
         super(Process, self).__init__(cb, model_unique_id=model_unique_id, initial_data=initial_data,
                                       force_init=force_init, full_doc=full_doc)
+        self._process_hashes = None
+        self._summary = None
+        self._tree = None
+        self._children = None
+        self._siblings = None
 
     @property
     def summary(self):
         """Returns organization-specific information about this process.
         """
-        return self._cb.select(Process.Summary, self.process_guid)
+        if self._summary is None:
+            self._summary = self._cb.select(Process.Summary, self.process_guid)
+        return self._summary
 
     def events(self, **kwargs):
         """Returns a query for events associated with this process's process GUID.
@@ -89,21 +113,87 @@ class Process(UnrefreshableModel):
 
         >>> tree = process.tree()
         """
-        data = self._cb.select(Tree).where(process_guid=self.process_guid).all()
-        return Tree(self._cb, initial_data=data)
+        # NOTE: Process is unrefreshable, so the tree and the other related
+        # objects below are fetched once and cached for the life of the instance.
+        if self._tree is None:
+            data = self._cb.select(Tree).where(process_guid=self.process_guid).all()
+            self._tree = Tree(self._cb, initial_data=data)
+        return self._tree
+
+    @classmethod
+    def bulk_events(cls, cb, processes, max_workers=10, **kwargs):
+        """Returns the events for several processes. The event search is scoped to
+        a single process GUID, so the per-process queries are issued concurrently.
+
+        :param cb: The API object to query with
+        :param processes: The processes to fetch events for
+        :type processes: list of :py:class:`Process`
+        :param int max_workers: The maximum number of concurrent queries
+        :param kwargs: Arguments to filter the event query with.
+        :return: A dict mapping each process GUID to a list of that process's events
+        :rtype: dict(str, list of :py:class:`Event`)
+
+        Example::
+
+        >>> events = Process.bulk_events(cb, processes, event_type="netconn")
+        >>> events[process.process_guid]
+        """
+        if not processes:
+            return {}
+
+        def _fetch_events(proc):
+            return list(proc.events(**kwargs))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip((proc.process_guid for proc in processes), executor.map(_fetch_events, processes)))
+
+    @classmethod
+    def bulk_trees(cls, cb, processes, max_workers=10):
+        """Returns the :py:class:`Tree` for several processes. The tree endpoint
+        only accepts a single process GUID, so the requests are issued concurrently.
+
+        :param cb: The API object to query with
+        :param processes: The processes to fetch trees for
+        :type processes: list of :py:class:`Process`
+        :param int max_workers: The maximum number of concurrent requests
+        :return: A dict mapping each process GUID to that process's tree
+        :rtype: dict(str, :py:class:`Tree`)
+
+        Example::
+
+        >>> trees = Process.bulk_trees(cb, processes)
+        >>> trees[process.process_guid].children
+        """
+        guids = [proc.process_guid for proc in processes]
+        if not guids:
+            return {}
+
+        def _fetch_tree(guid):
+            return Tree(cb, initial_data=cb.select(Tree).where(process_guid=guid).all())
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(guids, executor.map(_fetch_tree, guids)))
+
+    @property
+    def has_parent(self):
+        """Returns whether this process has a recorded parent, without querying the server.
+
+        :rtype: bool
+        """
+        return "parent_guid" in self._info
 
     @property
     def parents(self):
         """Returns a query for parent processes associated with this process.
 
-        :return: Returns a Query object with the appropriate search parameters for parent processes,
-                 or None if the process has no recorded parent
-        :rtype: :py:class:`cbapi.psc.threathunter.query.AsyncProcessQuery` or None
+        :return: Returns a Query object with the appropriate search parameters for parent processes.
+                 If the process has no recorded parent, the query is an
+                 :py:class:`cbapi.psc.threathunter.query.EmptyQuery`, which never has results.
+        :rtype: :py:class:`cbapi.psc.threathunter.query.AsyncProcessQuery`
         """
-        if "parent_guid" in self._info:
-            return self._cb.select(Process).where(process_guid=self.parent_guid)
-        else:
-            return []
+        if not self.has_parent:
+            return EmptyQuery(Process, self._cb)
+        return self._cb.select(Process).where(process_guid=self.parent_guid)
 
     @property
     def children(self):
@@ -112,10 +202,12 @@ class Process(UnrefreshableModel):
         :return: Returns a list of process objects
         :rtype: list of :py:class:`Process`
         """
-        return [
-            Process(self._cb, initial_data=child)
-            for child in self.summary.children
-        ]
+        if self._children is None:
+            self._children = [
+                Process(self._cb, initial_data=child)
+                for child in self.summary.children
+            ]
+        return self._children
 
     @property
     def siblings(self):
@@ -124,10 +216,12 @@ class Process(UnrefreshableModel):
         :return: Returns a list of process objects
         :rtype: list of :py:class:`Process`
         """
-        return [
-            Process(self._cb, initial_data=sibling)
-            for sibling in self.summary.siblings
-        ]
+        if self._siblings is None:
+            self._siblings = [
+                Process(self._cb, initial_data=sibling)
+                for sibling in self.summary.siblings
+            ]
+        return self._siblings
 
     @property
     def process_md5(self):
@@ -136,12 +230,7 @@ class Process(UnrefreshableModel):
         :return: A string representation of the process's MD5.
         :rtype: str
         """
-        # NOTE: We have to check _info instead of poking the attribute directly
-        # to avoid the missing attrbute login in NewBaseModel.
-        if "process_hash" in self._info:
-            return next((hsh for hsh in self.process_hash if len(hsh) == 32), None)
-        else:
-            return None
+        return self._process_hash_of_len(32)
 
     @property
     def process_sha256(self):
@@ -150,10 +239,18 @@ class Process(UnrefreshableModel):
         :return: A string representation of the process's SHA256.
         :rtype: str
         """
-        if "process_hash" in self._info:
-            return next((hsh for hsh in self.process_hash if len(hsh) == 64), None)
-        else:
-            return None
+        return self._process_hash_of_len(64)
+
+    def _process_hash_of_len(self, length):
+        # NOTE: We have to check _info instead of poking the attribute directly
+        # to avoid the missing attrbute login in NewBaseModel.
+        # Process is unrefreshable, so the hash list can't change underneath us
+        # and we only need to index it by hash length once.
+        if self._process_hashes is None:
+            # Built back to front so that the first hash of each length wins.
+            hashes = (self._info.get("process_hash") or [])[::-1]
+            self._process_hashes = dict(zip(map(len, hashes), hashes))
+        return self._process_hashes.get(length)
 
     @property
     def process_pids(self):
@@ -171,30 +268,55 @@ class Event(UnrefreshableModel):
     """Events can be queried for via ``CbThreatHunterAPI.select``
     or though an already selected process with ``Process.events()``.
     """
+    __slots__ = ()
     urlobject = '/threathunter/search/v1/orgs/{}/events/_search'
     validation_url = '/threathunter/search/v1/orgs/{}/events/search_validation'
     default_sort = 'last_update desc'
     primary_key = "process_guid"
+    _query_cls = Query
 
     @classmethod
     def _query_implementation(cls, cb):
-        return Query(cls, cb)
+        return cls._query_cls(cls, cb)
 
     def __init__(self, cb,  model_unique_id=None, initial_data=None, force_init=False, full_doc=True):
         super(Event, self).__init__(cb, model_unique_id=model_unique_id, initial_data=initial_data,
                                     force_init=force_init, full_doc=full_doc)
 
 
+class _LazyProcessList(object):
+    """A read-only sequence of :py:class:`Process` that only builds each
+    process from its raw data when that element is accessed.
+    """
+    def __init__(self, cb, raw):
+        self._cb = cb
+        self._raw = raw
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __iter__(self):
+        for item in self._raw:
+            yield Process(self._cb, initial_data=item)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [Process(self._cb, initial_data=raw) for raw in self._raw[item]]
+        return Process(self._cb, initial_data=self._raw[item])
+
+
 class Tree(UnrefreshableModel):
     """The preferred interface for interacting with Tree models
     is ``Process.tree()``.
     """
+    __slots__ = ()
     urlobject = '/threathunter/search/v1/orgs/{}/processes/tree'
     primary_key = 'process_guid'
+    _query_cls = TreeQuery
 
     @classmethod
     def _query_implementation(cls, cb):
-        return TreeQuery(cls, cb)
+        return cls._query_cls(cls, cb)
 
     def __init__(self, cb, model_unique_id=None, initial_data=None, force_init=False, full_doc=True):
         super(Tree, self).__init__(cb, model_unique_id=model_unique_id, initial_data=initial_data,
@@ -204,10 +326,13 @@ class Tree(UnrefreshableModel):
     def children(self):
         """Returns all of the children of the process that this tree is centered around.
 
-        :return: A list of :py:class:`Process` instances
-        :rtype: list of :py:class:`Process`
+        The :py:class:`Process` instances are created as they are accessed, so stopping
+        early while iterating over a large tree avoids building the rest of it.
+
+        :return: A sequence of :py:class:`Process` instances
+        :rtype: sequence of :py:class:`Process`
         """
-        return [Process(self._cb, initial_data=child) for child in self.nodes["children"]]
+        return _LazyProcessList(self._cb, self.nodes["children"])
 
 
 class Feed(FeedModel):
@@ -215,14 +340,21 @@ class Feed(FeedModel):
     """
     urlobject = "/threathunter/feedmgr/v2/orgs/{}/feeds"
     urlobject_single = "/threathunter/feedmgr/v2/orgs/{}/feeds/{}"
+    urlobject_feedinfo = "/threathunter/feedmgr/v2/orgs/{}/feeds/{}/feedinfo"
     primary_key = "id"
     swagger_meta_file = "psc/threathunter/models/feed.yaml"
+    _query_cls = FeedQuery
 
     @classmethod
     def _query_implementation(cls, cb):
-        return FeedQuery(cls, cb)
+        return cls._query_cls(cls, cb)
 
-    def __init__(self, cb, model_unique_id=None, initial_data=None):
+    def __init__(self, cb, model_unique_id=None, initial_data=None, use_cache=True):
+        """Creates a new Feed instance.
+
+        When fetched by ID, the feed may come from a copy cached for up to a minute;
+        pass `use_cache=False` to always fetch it from the server.
+        """
         item = {}
         reports = []
 
@@ -237,7 +369,7 @@ class Feed(FeedModel):
             url = self.urlobject_single.format(
                 cb.credentials.org_key, model_unique_id
             )
-            resp = cb.get_object(url)
+            resp = cb._get_cached_object(url, use_cache=use_cache)
             item = resp.get("feedinfo", {})
             reports = resp.get("reports", [])
 
@@ -246,7 +378,26 @@ class Feed(FeedModel):
         super(Feed, self).__init__(cb, model_unique_id=feed_id, initial_data=item,
                                    force_init=False, full_doc=True)
 
-        self._reports = [Report(cb, initial_data=report, feed_id=feed_id) for report in reports]
+        # NOTE: Report objects are only built from the raw report data if
+        # something actually asks for them; see _reports below.
+        self._raw_reports = reports
+        self._materialized_reports = None
+
+    @property
+    def _reports(self):
+        if self._materialized_reports is None:
+            self._materialized_reports = Report._from_raw_bulk(self._cb, self._raw_reports,
+                                                               feed_id=self._model_unique_id)
+        return self._materialized_reports
+
+    @_reports.setter
+    def _reports(self, reports):
+        self._materialized_reports = reports
+
+    def _invalidate_cache(self):
+        # Drop the cached copy of this feed so that the next Feed(cb, id) sees our changes.
+        url = self.urlobject_single.format(self._cb.credentials.org_key, self.id)
+        self._cb._invalidate_cached_object(url)
 
     def save(self, public=False):
         """Saves this feed on the ThreatHunter server.
@@ -262,9 +413,7 @@ class Feed(FeedModel):
             'reports': [report._info for report in self._reports],
         }
 
-        url = "/threathunter/feedmgr/v2/orgs/{}/feeds".format(
-            self._cb.credentials.org_key
-        )
+        url = self.urlobject.format(self._cb.credentials.org_key)
         if public:
             url = url + "/public"
 
@@ -282,7 +431,7 @@ class Feed(FeedModel):
         if self.access not in ["public", "private"]:
             raise InvalidObjectError("access should be public or private")
 
-        if not validators.url(self.provider_url):
+        if not _is_valid_url(self.provider_url):
             raise InvalidObjectError("provider_url should be a valid URL")
 
         for report in self._reports:
@@ -296,37 +445,48 @@ class Feed(FeedModel):
         if not self.id:
             raise InvalidObjectError("missing feed ID")
 
-        url = "/threathunter/feedmgr/v2/orgs/{}/feeds/{}".format(
-            self._cb.credentials.org_key,
-            self.id
-        )
+        url = self.urlobject_single.format(self._cb.credentials.org_key, self.id)
         self._cb.delete_object(url)
+        self._invalidate_cache()
 
-    def update(self, **kwargs):
+    def update(self, fields=None, **kwargs):
         """Update this feed's metadata with the given arguments.
 
         >>> feed.update(access="private")
+        >>> feed.update({"access": "private"})
 
+        :param fields: The fields to update, as an alternative to passing them as keyword arguments
+        :type fields: dict(str, str)
         :param kwargs: The fields to update
         :type kwargs: dict(str, str)
+        .. NOTE::
+            Unknown field names are ignored, with a warning. A future release
+            will raise :py:class:`ApiError` for them instead.
+
         :raise InvalidObjectError: if `id` is missing or :py:meth:`validate` fails
-        :raise ApiError: if an invalid field is specified
+        :raise ApiError: if both `fields` and `kwargs` are given
         """
         if not self.id:
             raise InvalidObjectError("missing feed ID")
 
-        for key, value in kwargs.items():
-            if key in self._info:
-                self._info[key] = value
+        if fields is not None and kwargs:
+            raise ApiError("update() takes either a dict of fields or keyword arguments, not both")
+
+        fields = fields if fields is not None else kwargs
+        invalid = set(fields).difference(self._info)
+        if invalid:
+            # TODO: raise ApiError here instead, one release after this warning ships.
+            log.warning("Ignoring invalid feed fields: {}".format(", ".join(sorted(invalid))))
+            fields = dict((key, value) for key, value in fields.items() if key not in invalid)
+
+        self._info.update(fields)
 
         self.validate()
 
-        url = "/threathunter/feedmgr/v2/orgs/{}/feeds/{}/feedinfo".format(
-            self._cb.credentials.org_key,
-            self.id,
-        )
+        url = self.urlobject_feedinfo.format(self._cb.credentials.org_key, self.id)
         new_info = self._cb.put_object(url, self._info).json()
         self._info.update(new_info)
+        self._invalidate_cache()
 
         return self
 
@@ -352,11 +512,9 @@ class Feed(FeedModel):
         rep_dicts = [report._info for report in reports]
         body = {"reports": rep_dicts}
 
-        url = "/threathunter/feedmgr/v2/orgs/{}/feeds/{}/reports".format(
-            self._cb.credentials.org_key,
-            self.id
-        )
+        url = Report.urlobject.format(self._cb.credentials.org_key, self.id)
         self._cb.post_object(url, body)
+        self._invalidate_cache()
 
     def append_reports(self, reports):
         """Append the given reports to this feed's current reports.
@@ -372,23 +530,25 @@ class Feed(FeedModel):
         rep_dicts += [report._info for report in self.reports]
         body = {"reports": rep_dicts}
 
-        url = "/threathunter/feedmgr/v2/orgs/{}/feeds/{}/reports".format(
-            self._cb.credentials.org_key,
-            self.id
-        )
+        url = Report.urlobject.format(self._cb.credentials.org_key, self.id)
         self._cb.post_object(url, body)
+        self._invalidate_cache()
 
 
 class Report(FeedModel):
     """Represents reports retrieved from a ThreatHunter feed.
     """
     urlobject = "/threathunter/feedmgr/v2/orgs/{}/feeds/{}/reports"
+    urlobject_single = "/threathunter/feedmgr/v2/orgs/{}/feeds/{}/reports/{}"
+    watchlist_urlobject = "/threathunter/watchlistmgr/v3/orgs/{}/reports"
+    watchlist_urlobject_single = "/threathunter/watchlistmgr/v3/orgs/{}/reports/{}"
     primary_key = "id"
     swagger_meta_file = "psc/threathunter/models/report.yaml"
+    _query_cls = ReportQuery
 
     @classmethod
     def _query_implementation(cls, cb):
-        return ReportQuery(cls, cb)
+        return cls._query_cls(cls, cb)
 
     def __init__(self, cb, model_unique_id=None, initial_data=None,
                  feed_id=None, from_watchlist=False):
@@ -405,11 +565,46 @@ class Report(FeedModel):
 
         self._feed_id = feed_id
         self._from_watchlist = from_watchlist
+        self._init_iocs()
 
-        if self.iocs:
-            self._iocs = IOC(cb, initial_data=self.iocs, report_id=self.id)
-        if self.iocs_v2:
-            self._iocs_v2 = [IOC_V2(cb, initial_data=ioc, report_id=self.id) for ioc in self.iocs_v2]
+    @classmethod
+    def _from_raw_bulk(cls, cb, raws, feed_id=None):
+        """Creates feed reports from raw API data, skipping the per-report
+        argument handling in ``__init__``.
+        """
+        if raws and not feed_id:
+            log.warning("Report created without feed ID or not from watchlist")
+
+        reports = cls._new_bulk(cb, raws)
+        for report in reports:
+            report._feed_id = feed_id
+            report._from_watchlist = False
+            report._init_iocs()
+        return reports
+
+    def _init_iocs(self):
+        # NOTE: Read the IOC data straight out of _info; the field descriptors hand
+        # back a copy, and the IOC objects should share their data with this report.
+        report_id = self._info.get("id")
+        iocs = self._info.get("iocs")
+        if iocs:
+            self._iocs = IOC(self._cb, initial_data=iocs, report_id=report_id)
+        iocs_v2 = self._info.get("iocs_v2")
+        if iocs_v2:
+            self._iocs_v2 = IOC_V2._from_raw_bulk(self._cb, iocs_v2, report_id=report_id)
+
+    def _report_url(self):
+        if self._from_watchlist:
+            return self.watchlist_urlobject_single.format(self._cb.credentials.org_key, self.id)
+        if not self._feed_id:
+            raise InvalidObjectError("missing Feed ID")
+        return self.urlobject_single.format(self._cb.credentials.org_key, self._feed_id, self.id)
+
+    def _invalidate_feed_cache(self):
+        # The cached copy of our feed lists its reports, so drop it whenever one of them changes.
+        if self._feed_id:
+            url = Feed.urlobject_single.format(self._cb.credentials.org_key, self._feed_id)
+            self._cb._invalidate_cached_object(url)
 
     def save_watchlist(self):
         """Saves this report *as a watchlist report*.
@@ -428,9 +623,7 @@ class Report(FeedModel):
         # and delete() to the correct (watchlist) endpoints.
         self._from_watchlist = True
 
-        url = "/threathunter/watchlistmgr/v3/orgs/{}/reports".format(
-            self._cb.credentials.org_key
-        )
+        url = self.watchlist_urlobject.format(self._cb.credentials.org_key)
         new_info = self._cb.post_object(url, self._info).json()
         self._info.update(new_info)
         return self
@@ -442,10 +635,10 @@ class Report(FeedModel):
         """
         super(Report, self).validate()
 
-        if self.link and not validators.url(self.link):
+        if self.link and not _is_valid_url(self.link):
             raise InvalidObjectError("link should be a valid URL")
 
-        if self.iocs_v2:
+        if self._info.get("iocs_v2"):
             [ioc.validate() for ioc in self._iocs_v2]
 
     def update(self, **kwargs):
@@ -468,19 +661,7 @@ class Report(FeedModel):
         if not self.id:
             raise InvalidObjectError("missing Report ID")
 
-        if self._from_watchlist:
-            url = "/threathunter/watchlistmgr/v3/orgs/{}/reports/{}".format(
-                self._cb.credentials.org_key,
-                self.id
-            )
-        else:
-            if not self._feed_id:
-                raise InvalidObjectError("missing Feed ID")
-            url = "/threathunter/feedmgr/v2/orgs/{}/feeds/{}/reports/{}".format(
-                self._cb.credentials.org_key,
-                self._feed_id,
-                self.id
-            )
+        url = self._report_url()
 
         for key, value in kwargs.items():
             if key in self._info:
@@ -493,6 +674,7 @@ class Report(FeedModel):
 
         new_info = self._cb.put_object(url, self._info).json()
         self._info.update(new_info)
+        self._invalidate_feed_cache()
         return self
 
     def delete(self):
@@ -506,21 +688,10 @@ class Report(FeedModel):
         if not self.id:
             raise InvalidObjectError("missing Report ID")
 
-        if self._from_watchlist:
-            url = "/threathunter/watchlistmgr/v3/orgs/{}/reports/{}".format(
-                self._cb.credentials.org_key,
-                self.id
-            )
-        else:
-            if not self._feed_id:
-                raise InvalidObjectError("missing Feed ID")
-            url = "/threathunter/feedmgr/v2/orgs/{}/feeds/{}/reports/{}".format(
-                self._cb.credentials.org_key,
-                self._feed_id,
-                self.id
-            )
+        url = self._report_url()
 
         self._cb.delete_object(url)
+        self._invalidate_feed_cache()
 
     @property
     def ignored(self):
@@ -646,7 +817,7 @@ class Report(FeedModel):
         :return: a list of IOCs
         :rtype: list(:py:class:`IOC_V2`)
         """
-        if not self.iocs_v2:
+        if not self._info.get("iocs_v2"):
             return []
 
         # NOTE(ww): This name is underscored because something in the model
@@ -660,6 +831,12 @@ class IOC(FeedModel):
     """Represents a collection of categorized IOCs.
     """
     swagger_meta_file = "psc/threathunter/models/iocs.yaml"
+    _value_validators = (
+        ("md5", validators.md5, "invalid MD5 checksum: {}"),
+        ("ipv4", validators.ipv4, "invalid IPv4 address: {}"),
+        ("ipv6", validators.ipv6, "invalid IPv6 address: {}"),
+        ("dns", validators.domain, "invalid domain: {}"),
+    )
 
     def __init__(self, cb, model_unique_id=None, initial_data=None, report_id=None):
         """Creates a new IOC instance.
@@ -681,21 +858,22 @@ class IOC(FeedModel):
         """
         super(IOC, self).validate()
 
-        for md5 in self.md5:
-            if not validators(md5):
-                raise InvalidObjectError("invalid MD5 checksum: {}".format(md5))
-        for ipv4 in self.ipv4:
-            if not validators(ipv4):
-                raise InvalidObjectError("invalid IPv4 address: {}".format(ipv4))
-        for ipv6 in self.ipv6:
-            if not validators(ipv6):
-                raise InvalidObjectError("invalid IPv6 address: {}".format(ipv6))
-        for dns in self.dns:
-            if not validators(dns):
-                raise InvalidObjectError("invalid domain: {}".format(dns))
-        for query in self.query:
-            if not self._cb.validate(query["search_query"]):
-                raise InvalidObjectError("invalid search query: {}".format(query["search_query"]))
+        for field, validator, message in self._value_validators:
+            for value in self._info.get(field) or ():
+                if not validator(value):
+                    raise InvalidObjectError(message.format(value))
+
+        # NOTE: Each query is validated by the server, so check them concurrently.
+        queries = [query["search_query"] for query in self.query]
+        if len(queries) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(queries), 10)) as executor:
+                results = list(executor.map(self._cb.validate_query, queries))
+        else:
+            results = [self._cb.validate_query(query) for query in queries]
+
+        for query, valid in zip(queries, results):
+            if not valid:
+                raise InvalidObjectError("invalid search query: {}".format(query))
 
 
 class IOC_V2(FeedModel):
@@ -718,6 +896,21 @@ class IOC_V2(FeedModel):
 
         self._report_id = report_id
 
+    @classmethod
+    def _from_raw_bulk(cls, cb, raws, report_id=None):
+        """Creates IOC_V2 instances from raw API data, skipping the per-IOC
+        argument handling in ``__init__``.
+
+        :raise ApiError: if any item of `raws` is empty
+        """
+        if not all(raws):
+            raise ApiError("IOC_V2 can only be initialized from initial_data")
+
+        iocs = cls._new_bulk(cb, raws)
+        for ioc in iocs:
+            ioc._report_id = report_id
+        return iocs
+
     def validate(self):
         """Validates this IOC_V2's state.
 
@@ -725,7 +918,7 @@ class IOC_V2(FeedModel):
         """
         super(IOC_V2, self).validate()
 
-        if self.link and not validators.url(self.link):
+        if self.link and not _is_valid_url(self.link):
             raise InvalidObjectError("link should be a valid URL")
 
     @property
@@ -798,10 +991,11 @@ class Watchlist(FeedModel):
     urlobject = "/threathunter/watchlistmgr/v2/watchlist"
     urlobject_single = "/threathunter/watchlistmgr/v2/watchlist/{}"
     swagger_meta_file = "psc/threathunter/models/watchlist.yaml"
+    _query_cls = WatchlistQuery
 
     @classmethod
     def _query_implementation(cls, cb):
-        return WatchlistQuery(cls, cb)
+        return cls._query_cls(cls, cb)
 
     def __init__(self, cb, model_unique_id=None, initial_data=None):
         item = {}
@@ -267,7 +267,8 @@ class Query(PaginatedQuery):
 
         log.debug("args: {}".format(str(args)))
 
-        self._total_results = int(self._cb.post_object(self._doc_class.urlobject, body=args)
+        url = self._doc_class.urlobject.format(self._cb.credentials.org_key)
+        self._total_results = int(self._cb.post_object(url, body=args)
                                   .json().get("response_header", {}).get("num_available", 0))
         self._count_valid = True
         return self._total_results
@@ -531,13 +532,32 @@ class TreeQuery(BaseQuery):
         results = self._cb.get_object(url, query_parameters=self._args)
 
         while results["incomplete_results"]:
-            result = self._cb.get_object(self._doc_class.urlobject, query_parameters=self._args)
+            result = self._cb.get_object(url, query_parameters=self._args)
             results["nodes"]["children"].extend(result["nodes"]["children"])
             results["incomplete_results"] = result["incomplete_results"]
 
         return results
 
 
+class EmptyQuery(AsyncProcessQuery):
+    """Represents a process query that is known to have no results, such as the
+    parents of a process without a parent. It never contacts the server.
+
+    It supports everything :py:class:`AsyncProcessQuery` does, so callers don't
+    need to tell the two apart: filters and sorting can still be chained onto it,
+    and the results are always empty.
+
+    >>> process.parents.where(process_name="cmd.exe").first()  # None
+    """
+    def _count(self):
+        self._total_results = 0
+        self._count_valid = True
+        return 0
+
+    def _search(self, start=0, rows=0):
+        return iter(())
+
+
 class FeedQuery(SimpleQuery):
     """Represents the logic for a :py:class:`Feed` query.
 
@@ -577,6 +597,7 @@ class ReportQuery(SimpleQuery):
 
     def where(self, **kwargs):
         self._args = dict(self._args, **kwargs)
+        self._full_init = False
         return self
 
     @property
@@ -584,16 +605,20 @@ class ReportQuery(SimpleQuery):
         if "feed_id" not in self._args:
             raise ApiError("required parameter feed_id missing")
 
-        feed_id = self._args["feed_id"]
+        if not self._full_init:
+            feed_id = self._args["feed_id"]
 
-        log.debug("Fetching all reports")
-        url = self._doc_class.urlobject.format(
-            self._cb.credentials.org_key,
-            feed_id,
-        )
-        resp = self._cb.get_object(url)
-        results = resp.get("results", [])
-        return [self._doc_class(self._cb, initial_data=item, feed_id=feed_id) for item in results]
+            log.debug("Fetching all reports")
+            url = self._doc_class.urlobject.format(
+                self._cb.credentials.org_key,
+                feed_id,
+            )
+            resp = self._cb.get_object(url)
+            results = resp.get("results", [])
+            self._results = [self._doc_class(self._cb, initial_data=item, feed_id=feed_id) for item in results]
+            self._full_init = True
+
+        return self._results
 
 
 class WatchlistQuery(SimpleQuery):
@@ -2,6 +2,8 @@ from cbapi.psc.threathunter.query import Query
 from cbapi.psc.rest_api import CbPSCBaseAPI
 from cbapi.psc.threathunter.models import ReportSeverity
 from cbapi.errors import CredentialError
+from cbapi.cache.lru import LRUCacheDict
+from copy import deepcopy
 import logging
 
 log = logging.getLogger(__name__)
@@ -12,6 +14,8 @@ class CbThreatHunterAPI(CbPSCBaseAPI):
 
     :param str profile: (optional) Use the credentials in the named profile when connecting to the Carbon Black server.
         Uses the profile named 'default' when not specified.
+    :param int object_cache_expiration: (optional) How many seconds single-object GETs, such as ``Feed(cb, id)``,
+        are cached for. Defaults to 60; 0 disables the cache.
 
     Usage::
 
@@ -19,17 +23,55 @@ class CbThreatHunterAPI(CbPSCBaseAPI):
     >>> cb = CbThreatHunterAPI(profile="production")
     """
     def __init__(self, *args, **kwargs):
+        object_cache_expiration = kwargs.pop("object_cache_expiration", 1*60)
         super(CbThreatHunterAPI, self).__init__(*args, **kwargs)
 
         if not self.credentials.get("org_key", None):
             raise CredentialError("No organization key specified")
 
+        # by default, keep cached objects for 1 minute, like select()
+        if object_cache_expiration:
+            self._object_cache = LRUCacheDict(max_size=1024, expiration=object_cache_expiration)
+        else:
+            self._object_cache = None
+
     def _perform_query(self, cls, **kwargs):
-        if hasattr(cls, "_query_implementation"):
+        # NOTE: Models that always use the same query class name it in _query_cls,
+        # which lets us skip the _query_implementation() call.
+        query_cls = getattr(cls, "_query_cls", None)
+        if query_cls is not None:
+            return query_cls(cls, self)
+        elif hasattr(cls, "_query_implementation"):
             return cls._query_implementation(self)
         else:
             return Query(cls, self, **kwargs)
 
+    def _get_cached_object(self, uri, use_cache=True):
+        """Like ``get_object``, but remembers the response for a short time so
+        that repeated requests for the same object don't each go to the server.
+
+        Callers get their own copy of the cached response, since models mutate
+        their ``_info`` in place. With `use_cache` False, the server is always
+        asked, and the fresh response replaces any cached one.
+        """
+        if self._object_cache is None:
+            return self.get_object(uri)
+
+        if use_cache:
+            try:
+                return deepcopy(self._object_cache[uri])
+            except KeyError:
+                pass
+
+        obj = self.get_object(uri)
+        self._object_cache[uri] = obj
+        return deepcopy(obj)
+
+    def _invalidate_cached_object(self, uri):
+        """Drops any cached response for the given URI."""
+        if self._object_cache is not None:
+            self._object_cache.__delete__(uri)
+
     def create(self, cls, data=None):
         """Creates a new model.
 
@@ -0,0 +1,453 @@
+import pytest
+from cbapi.psc.threathunter.rest_api import CbThreatHunterAPI
+from cbapi.psc.threathunter.models import Process, Event, Tree, Feed, Report, IOC, IOC_V2
+from cbapi.psc.threathunter.query import AsyncProcessQuery, Query, TreeQuery, FeedQuery, ReportQuery
+from cbapi.errors import ApiError, InvalidObjectError
+from test.cbtest import StubResponse, patch_cbapi
+
+
+FEED_INFO = {"id": "qwertyuiop", "name": "My Feed", "owner": "Z100", "provider_url": "https://example.com",
+             "summary": "Some feed", "category": "Testing", "access": "private"}
+GUID_A = "WNEXFKQ7-0002b226-000015bd-00000000-1d6225bbba74c00"
+GUID_B = "WNEXFKQ7-0002b226-00001a2c-00000000-1d6225bbba74c01"
+MD5 = "0123456789abcdef0123456789abcdef"
+SHA256 = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef"
+
+
+@pytest.fixture
+def api(monkeypatch):
+    api = CbThreatHunterAPI(url="https://example.com", token="ABCD/1234", org_key="Z100", ssl_verify=True)
+    patch_cbapi(monkeypatch, api)
+    return api
+
+
+def test_process_hashes(api):
+    proc = Process(api, initial_data={"process_guid": "WNEXFKQ7-0002b226-000015bd-00000000-1d6225bbba74c00",
+                                      "process_hash": [SHA256, MD5]})
+    assert proc.process_md5 == MD5
+    assert proc.process_sha256 == SHA256
+    assert proc.process_md5 == MD5
+
+
+def test_process_hashes_first_match(api):
+    other_md5 = "fedcba9876543210fedcba9876543210"
+    proc = Process(api, initial_data={"process_guid": GUID_A, "process_hash": [MD5, SHA256, other_md5]})
+    assert proc.process_md5 == MD5
+
+
+def test_process_hashes_missing(api):
+    proc = Process(api, initial_data={"process_guid": "WNEXFKQ7-0002b226-000015bd-00000000-1d6225bbba74c00"})
+    assert proc.process_md5 is None
+    assert proc.process_sha256 is None
+
+
+def test_process_hashes_null(api):
+    proc = Process(api, initial_data={"process_guid": GUID_A, "process_hash": None})
+    assert proc.process_md5 is None
+    assert proc.process_sha256 is None
+
+
+def test_feed_validate(api):
+    feed = Feed(api, initial_data=dict(FEED_INFO))
+    feed.validate()
+
+
+def test_feed_validate_missing_fields(api):
+    info = dict(FEED_INFO)
+    del info["owner"]
+    feed = Feed(api, initial_data=info)
+    with pytest.raises(InvalidObjectError) as excinfo:
+        feed.validate()
+    assert "owner" in str(excinfo.value)
+
+
+def test_process_bulk_events(monkeypatch, api):
+    _params = []
+
+    def _validate(url, query_parameters=None, default=None):
+        assert url == "/threathunter/search/v1/orgs/Z100/events/search_validation"
+        return {"valid": True}
+
+    def _search(url, body, **kwargs):
+        assert url == "/threathunter/search/v1/orgs/Z100/events/_search"
+        params = body["search_params"]
+        _params.append(params)
+        guid = params["cb.process_guid"]
+        docs = {GUID_A: [{"process_guid": GUID_A, "event_type": "netconn"},
+                         {"process_guid": GUID_A, "event_type": "netconn"}],
+                GUID_B: [{"process_guid": GUID_B, "event_type": "netconn"}]}.get(guid, [])
+        return StubResponse({"response_header": {"num_available": len(docs)}, "docs": docs})
+
+    patch_cbapi(monkeypatch, api, GET=_validate, POST=_search)
+    procs = [Process(api, initial_data={"process_guid": guid}) for guid in (GUID_A, GUID_B, "nonesuch")]
+    events = Process.bulk_events(api, procs, event_type="netconn")
+    assert set(params["cb.process_guid"] for params in _params) == set([GUID_A, GUID_B, "nonesuch"])
+    for params in _params:
+        assert params["q"].count("process_guid:") == 1
+        assert "event_type:netconn" in params["q"]
+    assert len(events[GUID_A]) == 2
+    assert len(events[GUID_B]) == 1
+    assert events["nonesuch"] == []
+
+
+def test_process_bulk_trees(monkeypatch, api):
+    def _get_tree(url, query_parameters=None, default=None):
+        assert url == "/threathunter/search/v1/orgs/Z100/processes/tree"
+        return {"incomplete_results": False, "nodes": {"children": [{"process_guid": "child"}]}}
+
+    patch_cbapi(monkeypatch, api, GET=_get_tree)
+    procs = [Process(api, initial_data={"process_guid": guid}) for guid in (GUID_A, GUID_B)]
+    trees = Process.bulk_trees(api, procs)
+    assert sorted(trees) == sorted([GUID_A, GUID_B])
+    assert trees[GUID_B].children[0].process_guid == "child"
+
+
+def test_process_tree_cached(monkeypatch, api):
+    _calls = []
+
+    def _get_tree(url, query_parameters=None, default=None):
+        _calls.append(url)
+        return {"incomplete_results": False, "nodes": {"children": []}}
+
+    patch_cbapi(monkeypatch, api, GET=_get_tree)
+    proc = Process(api, initial_data={"process_guid": GUID_A})
+    assert proc.tree() is proc.tree()
+    assert len(_calls) == 1
+
+
+def test_feed_append_reports_reads_current(monkeypatch, api):
+    _results = [{"id": "report1", "title": "Report 1"}, {"id": "report2", "title": "Report 2"}]
+    _posted = []
+
+    def _get_reports(url, query_parameters=None, default=None):
+        assert url == "/threathunter/feedmgr/v2/orgs/Z100/feeds/qwertyuiop/reports"
+        return {"results": list(_results)}
+
+    def _post_reports(url, body, **kwargs):
+        _posted.append([report["id"] for report in body["reports"]])
+        return StubResponse({"success": True})
+
+    patch_cbapi(monkeypatch, api, GET=_get_reports, POST=_post_reports)
+    feed = Feed(api, initial_data=dict(FEED_INFO))
+    assert [report.id for report in feed.reports] == ["report1", "report2"]
+    _results.pop()
+    new_report = Report(api, initial_data={"id": "report3", "title": "Report 3"}, feed_id=feed.id)
+    feed.append_reports([new_report])
+    assert _posted == [["report3", "report1"]]
+
+
+def test_feed_reports_built_lazily(api):
+    feed = Feed(api, initial_data={"feedinfo": dict(FEED_INFO),
+                                   "reports": [{"id": "report1", "title": "Report 1"}]})
+    assert feed._materialized_reports is None
+    assert [report.id for report in feed._reports] == ["report1"]
+    assert feed._reports[0]._feed_id == "qwertyuiop"
+    assert feed._reports is feed._reports
+
+
+def test_feed_get_cached(monkeypatch, api):
+    _calls = []
+
+    def _get_feed(url, parms=None, default=None):
+        assert url == "/threathunter/feedmgr/v2/orgs/Z100/feeds/qwertyuiop"
+        _calls.append(url)
+        return {"feedinfo": dict(FEED_INFO), "reports": []}
+
+    def _delete_feed(url):
+        return StubResponse(None, 204)
+
+    patch_cbapi(monkeypatch, api, GET=_get_feed, DELETE=_delete_feed)
+    feed = Feed(api, "qwertyuiop")
+    feed._info["name"] = "Changed"
+    assert Feed(api, "qwertyuiop").name == "My Feed"
+    assert len(_calls) == 1
+    feed.delete()
+    Feed(api, "qwertyuiop")
+    assert len(_calls) == 2
+
+
+def test_feed_get_uncached(monkeypatch, api):
+    _calls = []
+
+    def _get_feed(url, query_parameters=None, default=None):
+        _calls.append(url)
+        return {"feedinfo": dict(FEED_INFO, name="Feed {}".format(len(_calls))), "reports": []}
+
+    patch_cbapi(monkeypatch, api, GET=_get_feed)
+    assert Feed(api, "qwertyuiop").name == "Feed 1"
+    assert Feed(api, "qwertyuiop", use_cache=False).name == "Feed 2"
+    assert Feed(api, "qwertyuiop").name == "Feed 2"
+    assert len(_calls) == 2
+
+    uncached = CbThreatHunterAPI(url="https://example.com", token="ABCD/1234", org_key="Z100",
+                                 object_cache_expiration=0)
+    patch_cbapi(monkeypatch, uncached, GET=_get_feed)
+    Feed(uncached, "qwertyuiop")
+    Feed(uncached, "qwertyuiop")
+    assert len(_calls) == 4
+
+
+REPORT_ONE = {"id": "report1", "timestamp": 1, "title": "one", "description": "Report one", "severity": 5}
+
+
+def _patch_feed_with_reports(monkeypatch, api, reports):
+    def _get_feed(url, query_parameters=None, default=None):
+        assert url == "/threathunter/feedmgr/v2/orgs/Z100/feeds/qwertyuiop"
+        return {"feedinfo": dict(FEED_INFO), "reports": [dict(report) for report in reports]}
+
+    def _put_report(url, body, **kwargs):
+        assert url == "/threathunter/feedmgr/v2/orgs/Z100/feeds/qwertyuiop/reports/report1"
+        reports[0] = dict(body)
+        return StubResponse(body)
+
+    def _delete_report(url):
+        assert url == "/threathunter/feedmgr/v2/orgs/Z100/feeds/qwertyuiop/reports/report1"
+        del reports[0]
+        return StubResponse(None, 204)
+
+    patch_cbapi(monkeypatch, api, GET=_get_feed, PUT=_put_report, DELETE=_delete_report)
+
+
+def test_report_update_invalidates_feed_cache(monkeypatch, api):
+    _patch_feed_with_reports(monkeypatch, api, [dict(REPORT_ONE)])
+    report = Feed(api, "qwertyuiop")._reports[0]
+    report.update(title="changed")
+    assert Feed(api, "qwertyuiop")._reports[0].title == "changed"
+
+
+def test_report_delete_invalidates_feed_cache(monkeypatch, api):
+    _patch_feed_with_reports(monkeypatch, api, [dict(REPORT_ONE)])
+    report = Feed(api, "qwertyuiop")._reports[0]
+    report.delete()
+    assert Feed(api, "qwertyuiop")._reports == []
+
+
+def test_tree_children(api):
+    tree = Tree(api, initial_data={"nodes": {"children": [{"process_guid": GUID_A, "process_pid": [1]},
+                                                          {"process_guid": GUID_B, "process_pid": [2]}]}})
+    children = tree.children
+    assert len(children) == 2
+    assert [child.process_guid for child in children] == [GUID_A, GUID_B]
+    assert children[-1].process_guid == GUID_B
+    assert [child.process_guid for child in children[:1]] == [GUID_A]
+    assert next(child for child in children if child.process_pids == [1]).process_guid == GUID_A
+
+
+def test_ioc_validate(api):
+    ioc = IOC(api, initial_data={"md5": [MD5], "ipv4": ["10.0.0.1"], "ipv6": ["::1"], "dns": ["example.com"]})
+    ioc.validate()
+
+
+@pytest.mark.parametrize("field, value", [("md5", "xyzzy"), ("ipv4", "10.0.0.256"), ("ipv6", "::g"),
+                                          ("dns", "not a domain")])
+def test_ioc_validate_invalid(api, field, value):
+    ioc = IOC(api, initial_data={field: [value]})
+    with pytest.raises(InvalidObjectError) as excinfo:
+        ioc.validate()
+    assert value in str(excinfo.value)
+
+
+def test_process_has_no_instance_dict(api):
+    proc = Process(api, initial_data={"process_guid": GUID_A})
+    assert not hasattr(proc, "__dict__")
+    assert proc.process_guid == GUID_A
+
+
+@pytest.mark.parametrize("kwargs, expected_url", [
+    ({"feed_id": "qwertyuiop"}, "/threathunter/feedmgr/v2/orgs/Z100/feeds/qwertyuiop/reports/report1"),
+    ({"from_watchlist": True}, "/threathunter/watchlistmgr/v3/orgs/Z100/reports/report1"),
+])
+def test_report_delete(monkeypatch, api, kwargs, expected_url):
+    _urls = []
+
+    def _delete_report(url):
+        _urls.append(url)
+        return StubResponse(None, 204)
+
+    patch_cbapi(monkeypatch, api, DELETE=_delete_report)
+    report = Report(api, initial_data={"id": "report1", "title": "Report 1"}, **kwargs)
+    report.delete()
+    assert _urls == [expected_url]
+
+
+def test_report_delete_missing_feed_id(api):
+    report = Report(api, initial_data={"id": "report1", "title": "Report 1"})
+    with pytest.raises(InvalidObjectError):
+        report.delete()
+
+
+@pytest.mark.parametrize("url, valid", [
+    ("https://example.com/feeds/mine", True),
+    ("https://example.com:8443/feeds?id=1", True),
+    ("ftp://example.com", True),
+    ("https://-example.com", False),
+    ("https://example.com\n", False),
+    ("not a url", False),
+])
+def test_feed_validate_provider_url(api, url, valid):
+    feed = Feed(api, initial_data=dict(FEED_INFO, provider_url=url))
+    if valid:
+        feed.validate()
+    else:
+        with pytest.raises(InvalidObjectError):
+            feed.validate()
+
+
+@pytest.mark.parametrize("model, query_cls", [(Process, AsyncProcessQuery), (Event, Query), (Tree, TreeQuery),
+                                              (Feed, FeedQuery), (Report, ReportQuery)])
+def test_select_query_class(api, model, query_cls):
+    query = api.select(model)
+    assert type(query) is query_cls
+    assert query._doc_class is model
+
+
+def test_ioc_validate_queries(monkeypatch, api):
+    _queries = []
+
+    def _validate(url, query_parameters=None, default=None):
+        assert url == "/threathunter/search/v1/orgs/Z100/processes/search_validation"
+        _queries.append(query_parameters["q"])
+        return {"valid": query_parameters["q"] != "bogus"}
+
+    patch_cbapi(monkeypatch, api, GET=_validate)
+    ioc = IOC(api, initial_data={"query": [{"index_type": "events", "search_query": "process_name:a.exe"},
+                                           {"index_type": "events", "search_query": "process_name:b.exe"}]})
+    ioc.validate()
+    assert sorted(_queries) == ["process_name:a.exe", "process_name:b.exe"]
+
+    ioc = IOC(api, initial_data={"query": [{"index_type": "events", "search_query": "process_name:a.exe"},
+                                           {"index_type": "events", "search_query": "bogus"}]})
+    with pytest.raises(InvalidObjectError) as excinfo:
+        ioc.validate()
+    assert "bogus" in str(excinfo.value)
+
+
+def test_report_iocs_share_data(api):
+    report = Report(api, initial_data={"id": "report1", "title": "Report 1",
+                                       "iocs": {"md5": [MD5]},
+                                       "iocs_v2": [{"id": "ioc1", "match_type": "equality",
+                                                    "field": "process_hash", "values": [MD5]}]},
+                    feed_id="qwertyuiop")
+    assert report._iocs._info is report._info["iocs"]
+    assert [ioc._info for ioc in report.iocs_] == report._info["iocs_v2"]
+    assert report.iocs_[0]._info is report._info["iocs_v2"][0]
+
+
+@pytest.mark.parametrize("args, kwargs", [((), {"access": "public"}), (({"access": "public"},), {})])
+def test_feed_update(monkeypatch, api, args, kwargs):
+    _bodies = []
+
+    def _put_feedinfo(url, body, **kwargs):
+        assert url == "/threathunter/feedmgr/v2/orgs/Z100/feeds/qwertyuiop/feedinfo"
+        _bodies.append(dict(body))
+        return StubResponse(body)
+
+    patch_cbapi(monkeypatch, api, PUT=_put_feedinfo)
+    feed = Feed(api, initial_data=dict(FEED_INFO))
+    assert feed.update(*args, **kwargs) is feed
+    assert feed.access == "public"
+    assert _bodies == [dict(FEED_INFO, access="public")]
+
+
+def test_feed_update_both_args(api):
+    feed = Feed(api, initial_data=dict(FEED_INFO))
+    with pytest.raises(ApiError):
+        feed.update({"access": "public"}, name="New Name")
+    assert feed._info == FEED_INFO
+
+
+def test_feed_update_unknown_field(monkeypatch, api, caplog):
+    _bodies = []
+
+    def _put_feedinfo(url, body, **kwargs):
+        _bodies.append(dict(body))
+        return StubResponse(body)
+
+    patch_cbapi(monkeypatch, api, PUT=_put_feedinfo)
+    feed = Feed(api, initial_data=dict(FEED_INFO))
+    feed.update(access="public", bogus="value")
+    assert _bodies == [dict(FEED_INFO, access="public")]
+    assert "bogus" in caplog.text
+
+
+def test_process_without_parent(api):
+    proc = Process(api, initial_data={"process_guid": GUID_A})
+    assert not proc.has_parent
+    parents = proc.parents
+    assert not parents
+    assert len(parents) == 0
+    assert list(parents) == []
+    assert list(parents.all()) == []
+    assert parents.first() is None
+    assert parents[:5] == []
+    assert parents[0] is None
+    assert isinstance(parents, AsyncProcessQuery)
+    narrowed = parents.where(process_name="cmd.exe").and_(process_pid=1).or_(process_pid=2).not_(process_pid=3)
+    assert narrowed.sort_by("device_timestamp").timeout(1000) is parents
+    assert list(parents) == []
+
+
+def test_process_with_parent(api):
+    proc = Process(api, initial_data={"process_guid": GUID_A, "parent_guid": GUID_B})
+    assert proc.has_parent
+    assert isinstance(proc.parents, AsyncProcessQuery)
+    proc.parents.and_(process_name="evil.exe")
+    assert proc.parents is not proc.parents
+    assert "evil.exe" not in proc.parents._query_builder._collapse()
+
+
+def test_process_summary_incomplete(monkeypatch, api):
+    _responses = [{"incomplete_results": True, "children": []},
+                  {"incomplete_results": False, "process_guid": GUID_A, "children": [{"process_guid": GUID_B}]}]
+
+    def _get_summary(url, query_parameters=None, default=None):
+        assert url == "/threathunter/search/v1/orgs/Z100/processes/summary"
+        assert query_parameters == {"process_guid": GUID_A}
+        return _responses.pop(0)
+
+    patch_cbapi(monkeypatch, api, GET=_get_summary)
+    summary = Process.Summary(api, GUID_A)
+    assert summary.children == [{"process_guid": GUID_B}]
+    assert not _responses
+
+
+def test_tree_incomplete(monkeypatch, api):
+    _responses = [{"incomplete_results": True, "nodes": {"children": [{"process_guid": GUID_A}]}},
+                  {"incomplete_results": False, "nodes": {"children": [{"process_guid": GUID_B}]}}]
+
+    def _get_tree(url, query_parameters=None, default=None):
+        assert url == "/threathunter/search/v1/orgs/Z100/processes/tree"
+        return _responses.pop(0)
+
+    patch_cbapi(monkeypatch, api, GET=_get_tree)
+    tree = Process(api, initial_data={"process_guid": GUID_A}).tree()
+    assert [child.process_guid for child in tree.children] == [GUID_A, GUID_B]
+
+
+def test_feed_set_field(api):
+    feed = Feed(api, initial_data=dict(FEED_INFO))
+    assert isinstance(Feed._valid_fields, frozenset)
+    feed.name = "New Name"
+    assert feed.name == "New Name"
+    assert feed.is_dirty()
+
+
+def test_report_bulk_matches_init(api):
+    raw = {"id": "rpt1", "title": "Report", "iocs_v2": [{"id": "ioc1", "match_type": "equality",
+                                                         "field": "process_name", "values": ["a.exe"]}]}
+    expected = Report(api, initial_data=dict(raw), feed_id="feed1")
+    report, = Report._from_raw_bulk(api, [raw], feed_id="feed1")
+    assert report._info is raw
+    assert report._feed_id == expected._feed_id
+    assert report._from_watchlist == expected._from_watchlist
+    assert report._full_init and not report.is_dirty()
+    ioc, = report.iocs_
+    assert isinstance(ioc, IOC_V2)
+    assert ioc._info is raw["iocs_v2"][0]
+    assert ioc._report_id == "rpt1"
+    assert ioc.values == ["a.exe"]
+
+
+def test_ioc_v2_bulk_empty(api):
+    with pytest.raises(ApiError):
+        IOC_V2._from_raw_bulk(api, [{"id": "ioc1"}, {}])
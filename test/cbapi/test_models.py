@@ -0,0 +1,41 @@
+import pytest
+from datetime import datetime
+from cbapi.models import MutableBaseModel
+from cbapi.psc.defense.models import Device
+from cbapi.psc.threathunter.rest_api import CbThreatHunterAPI
+from test.cbtest import patch_cbapi
+
+
+class LinkedModel(MutableBaseModel):
+    swagger_meta_file = "psc/threathunter/models/report.yaml"
+    foreign_keys = {"linked": (MutableBaseModel, "link")}
+
+
+@pytest.fixture
+def api(monkeypatch):
+    api = CbThreatHunterAPI(url="https://example.com", token="ABCD/1234", org_key="Z100", ssl_verify=True)
+    patch_cbapi(monkeypatch, api)
+    return api
+
+
+@pytest.mark.parametrize("value, expected", [
+    (1546300800000, datetime(2019, 1, 1)),
+    (1546300800000.0, datetime(2019, 1, 1)),
+    (True, datetime(1970, 1, 1)),
+    ("not a timestamp", datetime(1970, 1, 1)),
+])
+def test_epoch_date_time_field(api, value, expected):
+    device = Device(api, 1, initial_data={"deviceId": 1, "createTime": value})
+    assert device.createTime == expected
+
+
+def test_foreign_key_field_set(api):
+    first = LinkedModel(api, initial_data={"id": "first"}, full_doc=True)
+    second = LinkedModel(api, initial_data={"id": "second"}, full_doc=True)
+    first.linked = second
+    assert first.link == "second"
+    assert first.is_dirty()
+    first.linked = "third"
+    assert first.link == "third"
+    assert second.link is None
+    assert "link" not in vars(LinkedModel.linked)